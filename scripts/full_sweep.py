@@ -13,6 +13,7 @@ warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed .*
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from tests.llama_server_test_utils import (
+    encode_json,
     extract_token_count,
     post_json,
     start_llama_servers,
@@ -112,6 +113,14 @@ def run_batch(
     retry_attempts,
     retry_sleep_s,
 ):
+    body = encode_json(
+        {
+            "prompt": prompt,
+            "n_predict": n_predict,
+            "temperature": temperature,
+            "stream": False,
+        }
+    )
     start_time = time.time()
     results = []
     errors = 0
@@ -122,12 +131,7 @@ def run_batch(
             executor.submit(
                 post_json_with_retry,
                 f"{base_url}/completion",
-                {
-                    "prompt": prompt,
-                    "n_predict": n_predict,
-                    "temperature": temperature,
-                    "stream": False,
-                },
+                body,
                 request_timeout,
                 retry_attempts,
                 retry_sleep_s,
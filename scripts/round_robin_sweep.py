@@ -13,6 +13,7 @@ warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed .*
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from tests.llama_server_test_utils import (
+    encode_json,
     extract_token_count,
     post_json,
     start_llama_servers,
@@ -79,6 +80,14 @@ def post_json_with_retry(url, payload, max_attempts=8, base_sleep_s=0.5):
 
 
 def run_batch(base_url, prompt, n_predict, concurrency, total_requests, temperature):
+    body = encode_json(
+        {
+            "prompt": prompt,
+            "n_predict": n_predict,
+            "temperature": temperature,
+            "stream": False,
+        }
+    )
     start_time = time.time()
     results = []
     errors = 0
@@ -88,12 +97,7 @@ def run_batch(base_url, prompt, n_predict, concurrency, total_requests, temperat
             executor.submit(
                 post_json_with_retry,
                 f"{base_url}/completion",
-                {
-                    "prompt": prompt,
-                    "n_predict": n_predict,
-                    "temperature": temperature,
-                    "stream": False,
-                },
+                body,
             )
             for _ in range(total_requests)
         ]
@@ -1,12 +1,15 @@
 import contextlib
+import http.client
 import json
 import os
 import shutil
 import socket
 import subprocess
 import tempfile
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from pathlib import Path
 
@@ -14,6 +17,8 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8080
 
+_http_local = threading.local()
+
 
 def _find_llama_cpp_dir():
     search_roots = [REPO_ROOT, *REPO_ROOT.parents]
@@ -137,7 +142,7 @@ def _wait_for_completion_ready(host, port, timeout_s=120):
         "temperature": 0.0,
         "stream": False,
     }
-    body = json.dumps(payload).encode("utf-8")
+    body = encode_json(payload)
 
     while time.time() < deadline:
         request = urllib.request.Request(
@@ -166,8 +171,7 @@ def _wait_for_completion_ready(host, port, timeout_s=120):
     raise RuntimeError(f"Model did not become ready: {last_error}")
 
 
-@contextlib.contextmanager
-def start_llama_server(port=None, host=None, extra_args=None, ready_timeout_s=None):
+def _spawn_llama_server(port=None, host=None, extra_args=None):
     server_bin = resolve_llama_server_bin()
     model_path = resolve_model_path()
     if not os.path.isfile(server_bin):
@@ -219,26 +223,43 @@ def start_llama_server(port=None, host=None, extra_args=None, ready_timeout_s=No
         stderr=subprocess.DEVNULL,
         text=True,
     )
+    return {
+        "host": host,
+        "port": port,
+        "base_url": f"http://{host}:{port}",
+        "process": process,
+    }
+
+
+def _wait_for_llama_server_ready(server, ready_timeout_s=None):
+    bind_timeout = int(os.environ.get("LLAMA_SERVER_BIND_TIMEOUT", "180"))
+    _wait_for_server(server["host"], server["port"], timeout_s=bind_timeout)
+    completion_timeout = ready_timeout_s
+    if completion_timeout is None:
+        completion_timeout = int(os.environ.get("LLAMA_READY_TIMEOUT", "120"))
+    _wait_for_completion_ready(
+        server["host"], server["port"], timeout_s=completion_timeout
+    )
+
+
+def _stop_llama_server(server):
+    process = server["process"]
+    process.terminate()
     try:
-        bind_timeout = int(os.environ.get("LLAMA_SERVER_BIND_TIMEOUT", "180"))
-        _wait_for_server(host, port, timeout_s=bind_timeout)
-        completion_timeout = ready_timeout_s
-        if completion_timeout is None:
-            completion_timeout = int(os.environ.get("LLAMA_READY_TIMEOUT", "120"))
-        _wait_for_completion_ready(host, port, timeout_s=completion_timeout)
-        yield {
-            "host": host,
-            "port": port,
-            "base_url": f"http://{host}:{port}",
-            "process": process,
-        }
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait(timeout=5)
+
+
+@contextlib.contextmanager
+def start_llama_server(port=None, host=None, extra_args=None, ready_timeout_s=None):
+    server = _spawn_llama_server(port=port, host=host, extra_args=extra_args)
+    try:
+        _wait_for_llama_server_ready(server, ready_timeout_s=ready_timeout_s)
+        yield server
     finally:
-        process.terminate()
-        try:
-            process.wait(timeout=10)
-        except subprocess.TimeoutExpired:
-            process.kill()
-            process.wait(timeout=5)
+        _stop_llama_server(server)
 
 
 @contextlib.contextmanager
@@ -254,23 +275,42 @@ def start_llama_servers(
         raise ValueError("count must be >= 1")
     if base_port is None:
         base_port = _pick_port(allow_env_port=False)
+    concurrent_startup = os.environ.get(
+        "LLAMA_SERVER_CONCURRENT_STARTUP", "0"
+    ).lower() in {"1", "true", "yes"}
 
     servers = []
     with contextlib.ExitStack() as stack:
-        for index in range(count):
-            port = base_port + index
-            servers.append(
-                stack.enter_context(
-                    start_llama_server(
-                        port=port,
-                        host=host,
-                        extra_args=extra_args,
-                        ready_timeout_s=ready_timeout_s,
+        if concurrent_startup:
+            # Launch every instance before waiting on any of them so the model
+            # loads overlap: startup costs about the slowest load, not the sum.
+            for index in range(count):
+                server = _spawn_llama_server(
+                    port=base_port + index,
+                    host=host,
+                    extra_args=extra_args,
+                )
+                stack.callback(_stop_llama_server, server)
+                servers.append(server)
+                if startup_delay_s:
+                    time.sleep(startup_delay_s)
+            for server in servers:
+                _wait_for_llama_server_ready(server, ready_timeout_s=ready_timeout_s)
+        else:
+            for index in range(count):
+                port = base_port + index
+                servers.append(
+                    stack.enter_context(
+                        start_llama_server(
+                            port=port,
+                            host=host,
+                            extra_args=extra_args,
+                            ready_timeout_s=ready_timeout_s,
+                        )
                     )
                 )
-            )
-            if startup_delay_s:
-                time.sleep(startup_delay_s)
+                if startup_delay_s:
+                    time.sleep(startup_delay_s)
         yield servers
 
 
@@ -361,8 +401,69 @@ def start_nginx_round_robin(upstreams, listen_port, listen_host=None):
         temp_dir.cleanup()
 
 
+def _keepalive_enabled():
+    return os.environ.get("LLAMA_HTTP_KEEPALIVE", "0").lower() in {"1", "true", "yes"}
+
+
+def _post_json_keepalive(url, body, timeout):
+    # One persistent connection per (worker thread, host, port), so a batch pays
+    # the TCP handshake once per worker instead of once per request.
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.hostname, parts.port or 80)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    connections = getattr(_http_local, "connections", None)
+    if connections is None:
+        connections = _http_local.connections = {}
+
+    for attempt in range(2):
+        conn = connections.get(key)
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPConnection(key[0], key[1], timeout=timeout)
+            connections[key] = conn
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request(
+                "POST",
+                path,
+                body=body,
+                headers={"Content-Type": "application/json"},
+            )
+            resp = conn.getresponse()
+            data = resp.read().decode("utf-8", errors="replace")
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            connections.pop(key, None)
+            # The server may drop an idle keep-alive connection; retry once fresh.
+            if reused and attempt == 0:
+                continue
+            raise
+        except Exception:
+            conn.close()
+            connections.pop(key, None)
+            raise
+
+        if resp.will_close:
+            conn.close()
+            connections.pop(key, None)
+        if not 200 <= resp.status < 300:
+            raise RuntimeError(f"HTTP error {resp.status}: {data}")
+        return json.loads(data)
+
+
+def encode_json(payload):
+    return json.dumps(payload).encode("utf-8")
+
+
 def post_json(url, payload, timeout=120):
-    body = json.dumps(payload).encode("utf-8")
+    # Pre-encoded bodies (see encode_json) are sent as-is so fan-out loops can
+    # serialize the shared payload once per batch instead of once per request.
+    body = payload if isinstance(payload, bytes) else encode_json(payload)
+    if _keepalive_enabled():
+        return _post_json_keepalive(url, body, timeout)
     request = urllib.request.Request(
         url,
         data=body,
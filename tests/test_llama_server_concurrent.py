@@ -8,6 +8,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 warnings.filterwarnings("ignore", category=ResourceWarning)
 
 from tests.llama_server_test_utils import (
+    encode_json,
     extract_token_count,
     extract_tokens_per_second,
     post_json,
@@ -43,18 +44,21 @@ class LlamaServerConcurrentRequestTest(unittest.TestCase):
             concurrency = total_requests
 
         with start_llama_server() as server:
+            body = encode_json(
+                {
+                    "prompt": prompt,
+                    "n_predict": n_predict,
+                    "temperature": 0.3,
+                    "stream": False,
+                }
+            )
             start_time = time.time()
             with ThreadPoolExecutor(max_workers=concurrency) as executor:
                 futures = [
                     executor.submit(
                         post_json,
                         f"{server['base_url']}/completion",
-                        {
-                            "prompt": prompt,
-                            "n_predict": n_predict,
-                            "temperature": 0.3,
-                            "stream": False,
-                        },
+                        body,
                     )
                     for _ in range(total_requests)
                 ]
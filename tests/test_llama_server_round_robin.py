@@ -8,6 +8,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed .*socket")
 
 from tests.llama_server_test_utils import (
+    encode_json,
     extract_token_count,
     extract_tokens_per_second,
     post_json,
@@ -58,18 +59,21 @@ class LlamaServerRoundRobinTest(unittest.TestCase):
                 listen_port=nginx_port,
                 listen_host=servers[0]["host"],
             ) as proxy:
+                body = encode_json(
+                    {
+                        "prompt": prompt,
+                        "n_predict": n_predict,
+                        "temperature": 0.3,
+                        "stream": False,
+                    }
+                )
                 start_time = time.time()
                 with ThreadPoolExecutor(max_workers=concurrency) as executor:
                     futures = [
                         executor.submit(
                             post_json,
                             f"{proxy['base_url']}/completion",
-                            {
-                                "prompt": prompt,
-                                "n_predict": n_predict,
-                                "temperature": 0.3,
-                                "stream": False,
-                            },
+                            body,
                         )
                         for _ in range(total_requests)
                     ]
@@ -12,6 +12,7 @@ warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed .*
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from tests.llama_server_test_utils import (
+    encode_json,
     extract_token_count,
     extract_tokens_per_second,
     post_json,
@@ -70,18 +71,21 @@ class LlamaServerThreadsSweepTest(unittest.TestCase):
                     extra_args += ["--threads-http", str(threads_http_value)]
 
                 with start_llama_server(extra_args=extra_args) as server:
+                    body = encode_json(
+                        {
+                            "prompt": prompt,
+                            "n_predict": n_predict,
+                            "temperature": 0.3,
+                            "stream": False,
+                        }
+                    )
                     start_time = time.time()
                     with ThreadPoolExecutor(max_workers=concurrency) as executor:
                         futures = [
                             executor.submit(
                                 post_json,
                                 f"{server['base_url']}/completion",
-                                {
-                                    "prompt": prompt,
-                                    "n_predict": n_predict,
-                                    "temperature": 0.3,
-                                    "stream": False,
-                                },
+                                body,
                             )
                             for _ in range(total_requests)
                         ]